@@ -18,17 +18,39 @@ class LatticeError(Exception):
 class _Stabilizer(metaclass=ABCMeta):
     """
     A blueprint for stabilizer classes, such as plaquettes for surface codes.
+
+    Subclasses implement either entangle, or entangle_step together with
+    num_steps to split the entangling circuit into CNOT time steps,
+    so that all plaquettes of a lattice can be entangled in parallel layers.
     """
 
-    def __init__(self, circ: QuantumCircuit, qubit_indices: List[List[Qubit]]):
+    num_steps: int = 1
+
+    def __init__(self, circ: QuantumCircuit, qubit_indices: List[Optional[Qubit]]):
         self.circ = circ
         self.qubit_indices = qubit_indices
 
-    @abstractmethod
-    def entangle(self):
+    def entangle(self) -> None:
         """
         Entangles qubits to form a plaquette
         """
+        for step in range(self.num_steps):
+            self.entangle_step(step)
+
+    # step is unused by default, as the whole of entangle is a single time step
+    def entangle_step(self, step: int) -> None:  # pylint: disable=unused-argument
+        """
+        Entangles the qubits of this plaquette that are scheduled for
+        the given CNOT time step (0 <= step < num_steps).
+
+        By default, a stabilizer that only implements entangle
+        runs its whole circuit as a single time step.
+        """
+        if type(self).entangle is _Stabilizer.entangle:
+            raise NotImplementedError(
+                "Stabilizers must implement either entangle or entangle_step."
+            )
+        self.entangle()
 
 
 class _TopologicalLattice(Generic[TQubit], metaclass=ABCMeta):
@@ -36,6 +58,22 @@ class _TopologicalLattice(Generic[TQubit], metaclass=ABCMeta):
     This abstract class contains a blueprint for lattice construction.
     """
 
+    __slots__ = (
+        "name",
+        "circ",
+        "params",
+        "d",
+        "num_syn",
+        "num_data",
+        "qregisters",
+        "cregisters",
+        "_data_qreg",
+        "_all_qubits",
+        "qubit_indices",
+        "stabilizers",
+        "_cached_layer",
+    )
+
     def __init__(
         self, params: Dict[str, float], name: str, circ: QuantumCircuit,
     ):
@@ -58,19 +96,31 @@ class _TopologicalLattice(Generic[TQubit], metaclass=ABCMeta):
         self.circ = circ
         self.params: Dict[str, float] = params
         self._params_validate_and_generate()
+        self.d = int(self.params["d"])
+        self.num_syn = int(self.params["num_syn"])
+        self.num_data = int(self.params["num_data"])
 
         self.qregisters: Dict[str, QuantumRegister] = {}  # quantum
         self.cregisters: Dict[str, ClassicalRegister] = {}  # classical
         self._gen_registers()
 
         assert "data" in self.qregisters, "There should be a data qubits register."
+        self._data_qreg: QuantumRegister = self.qregisters["data"]
 
         # add registerse to circ
-        registers = list(self.qregisters.values()) + list(self.cregisters.values())
-        self.circ.add_register(*registers)
+        self.circ.add_register(*self.qregisters.values(), *self.cregisters.values())
+        self._all_qubits: List[Qubit] = [
+            qubit for register in self.qregisters.values() for qubit in register
+        ]
 
+        self.qubit_indices: List[List[Optional[Qubit]]]
+        self.stabilizers: List[Type[_Stabilizer]]
         self.qubit_indices, self.stabilizers = self._gen_qubit_indices_and_stabilizers()
 
+        # the default stabilizer layer is fixed by the lattice geometry,
+        # so build it once here and replay it onto circ on every entangle
+        self._cached_layer = self._build_layer(self.qubit_indices, self.stabilizers)
+
     @abstractmethod
     def _params_validate_and_generate(self) -> None:
         """
@@ -122,13 +172,86 @@ class _TopologicalLattice(Generic[TQubit], metaclass=ABCMeta):
                 List of stabilizers for each plaquette.
                 This is optional, and will be used instead of self.stabilizers if provided.
         """
-        qubit_indices = qubit_indices if qubit_indices else self.qubit_indices
-        stabilizers = stabilizers if stabilizers else self.stabilizers
+        if qubit_indices is None and stabilizers is None:
+            self._entangle_cached()
+            return
+
+        if qubit_indices is None:
+            qubit_indices = self.qubit_indices
+        if stabilizers is None:
+            stabilizers = self.stabilizers
 
-        for i, stabilizer_cls in enumerate(stabilizers):
-            stabilizer = stabilizer_cls(self.circ, qubit_indices[i])
-            stabilizer.entangle()
-            self.circ.barrier()
+        self._entangle_onto(self.circ, qubit_indices, stabilizers)
+
+    def _entangle_onto(
+        self,
+        circ: QuantumCircuit,
+        qubit_indices: List[List[Qubit]],
+        stabilizers: List[Type[_Stabilizer]],
+    ) -> None:
+        """
+        Appends the plaquettes' stabilizer circuits onto circ one CNOT time step
+        at a time, so plaquettes are entangled in parallel, with a barrier
+        across this lattice's qubits after each time step.
+        """
+        plaquettes = [
+            stabilizer_cls(circ, plaquette)
+            for stabilizer_cls, plaquette in zip(stabilizers, qubit_indices)
+        ]
+        num_steps = max((plaquette.num_steps for plaquette in plaquettes), default=0)
+        for step in range(num_steps):
+            for plaquette in plaquettes:
+                if step < plaquette.num_steps:
+                    plaquette.entangle_step(step)
+            circ.barrier(*self._all_qubits)
+
+    def _build_layer(
+        self,
+        qubit_indices: List[List[Qubit]],
+        stabilizers: List[Type[_Stabilizer]],
+    ) -> QuantumCircuit:
+        """
+        Builds a circuit on this lattice's quantum registers that entangles
+        the given plaquettes, to be replayed onto circ by _entangle_cached.
+        """
+        layer = QuantumCircuit(*self.qregisters.values())
+        self._entangle_onto(layer, qubit_indices, stabilizers)
+        return layer
+
+    def _entangle_cached(self, layer: Optional[QuantumCircuit] = None) -> None:
+        """
+        Entangles plaquettes by replaying a layer built by _build_layer.
+
+        Args:
+            layer (Optional[QuantumCircuit]):
+                Layer to replay onto circ. Defaults to the layer of all plaquettes
+                built from self.qubit_indices and self.stabilizers at construction.
+        """
+        layer = self._cached_layer if layer is None else layer
+        self.circ.compose(layer, qubits=self._all_qubits, inplace=True)
+
+    @abstractmethod
+    def stabilize(self, syndrome_readouts: ClassicalRegister) -> None:
+        """
+        Run a single round of stabilization (entangle, measure and reset
+        syndrome qubits), measuring into syndrome_readouts.
+        """
+
+    def id(self) -> None:
+        """
+        Inserts an identity on the data and syndrome qubits,
+        followed by a barrier across this lattice's qubits.
+        """
+        self.circ.id(self._all_qubits)
+        self.circ.barrier(*self._all_qubits)
+
+    def id_data(self) -> None:
+        """
+        Inserts an identity on the data qubits only,
+        followed by a barrier across this lattice's qubits.
+        """
+        self.circ.id(self._data_qreg)
+        self.circ.barrier(*self._all_qubits)
 
     @abstractmethod
     def reset_x(self) -> None:
@@ -240,6 +363,8 @@ class TopologicalQubit(Generic[TQubit], metaclass=ABCMeta):
     that should be implemented by subclasses.
     """
 
+    __slots__ = ("lattice", "name", "circ")
+
     @property
     @abstractmethod
     def lattice_type(self):
@@ -283,7 +408,16 @@ class TopologicalQubit(Generic[TQubit], metaclass=ABCMeta):
         return self.circ.draw(**kwargs)
 
     def __str__(self) -> str:
-        return self.circ.__str__()
+        """
+        Short summary of this TQubit.
+        Use draw(output="text") for a text drawing of the underlying circuit.
+        """
+        return "{}(name={!r}, lattice={}, gates={})".format(
+            type(self).__name__,
+            self.name,
+            type(self.lattice).__name__,
+            len(self.circ.data),
+        )
 
     @abstractmethod
     def stabilize(self) -> None:
@@ -296,17 +430,14 @@ class TopologicalQubit(Generic[TQubit], metaclass=ABCMeta):
         Inserts an identity on the data and syndrome qubits.
         This allows us to create an isolated noise model by inserting errors only on identity gates.
         """
-        for register in self.lattice.qregisters.values():
-            self.circ.id(register)
-        self.circ.barrier()
+        self.lattice.id()
 
     def id_data(self) -> None:
         """
         Inserts an identity on the data qubits only.
         This allows us to create an isolated noise model by inserting errors only on identity gates.
         """
-        self.circ.id(self.lattice.qregisters["data"])
-        self.circ.barrier()
+        self.lattice.id_data()
 
     def reset_x(self) -> None:
         """
@@ -358,7 +489,7 @@ class TopologicalQubit(Generic[TQubit], metaclass=ABCMeta):
         Additional Information:
             Exactly one of control or target must be provided.
         """
-        if not (bool(control) ^ bool(target)):
+        if (control is None) == (target is None):
             raise ValueError("Please specify exactly one of source or target")
         self.lattice.cx(control, target)
 
@@ -20,16 +20,19 @@ class _Parity(_Stabilizer):
     Parity syndrome measurement for Repetition code.
     """
 
-    def entangle(self) -> None:
+    num_steps = 2
+
+    def entangle_step(self, step: int) -> None:
         """
         Parity measurement on nearby data qubits.
+        Left data qubit first, then right.
         """
         syndrome = self.qubit_indices[0]
         left = self.qubit_indices[1]
         right = self.qubit_indices[2]
 
-        self.circ.cx(left, syndrome)
-        self.circ.cx(right, syndrome)
+        data = [left, right][step]
+        self.circ.cx(data, syndrome)
 
 
 class _RepetitionLattice(_TopologicalLattice):
@@ -50,6 +53,8 @@ class _RepetitionLattice(_TopologicalLattice):
     d=5 Rep Code
     """
 
+    __slots__ = ("geometry",)
+
     def __init__(self, params: Dict[str, float], name: str, circ: QuantumCircuit):
         """
         Initializes this Topological Lattice class.
@@ -114,7 +119,7 @@ class _RepetitionLattice(_TopologicalLattice):
         """
         geometry = {"mz": []}
 
-        for i in range(int(self.params["num_syn"])):
+        for i in range(self.num_syn):
             syn = i
             left = i
             right = i + 1
@@ -153,6 +158,19 @@ class _RepetitionLattice(_TopologicalLattice):
                 stabilizers.append(stabilizer_cls)
         return qubit_indices, stabilizers
 
+    def stabilize(self, syndrome_readouts: ClassicalRegister) -> None:
+        """
+        Run a single round of stabilization (entangle, measure and reset
+        syndrome qubits), measuring into a syndrome register of the form
+        "Z_{N}Z_{N-1}...Z_{0}".
+        """
+        self.entangle()
+
+        # measure syndromes
+        self.circ.measure(self.qregisters["mz"], syndrome_readouts)
+        self.circ.reset(self.qregisters["mz"])
+        self.circ.barrier(*self._all_qubits)
+
     def extract_final_stabilizer_and_logical_readout_z(
         self, final_readout_string: str
     ) -> Tuple[int, str]:
@@ -388,7 +406,7 @@ class _RepetitionLattice(_TopologicalLattice):
 
         Z = []
         for T, syndrome in enumerate(z_syndromes):
-            for loc in range(int(self.params["num_syn"])):
+            for loc in range(self.num_syn):
                 if syndrome & 1 << loc:
                     Z.append((float(T), 0.5 + loc, 0.0))
         return (
@@ -403,6 +421,8 @@ class RepetitionQubit(TopologicalQubit):
     circuit, so we chose to subclass and extend TopologicalQubit which extends QuantumCircuit.
     """
 
+    __slots__ = ()
+
     lattice_type = _RepetitionLattice
 
     def stabilize(self) -> None:
@@ -419,11 +439,4 @@ class RepetitionQubit(TopologicalQubit):
         ] = syndrome_readouts
         self.circ.add_register(syndrome_readouts)
 
-        self.lattice.entangle()
-
-        # measure syndromes
-        self.circ.measure(
-            self.lattice.qregisters["mz"], syndrome_readouts,
-        )
-        self.circ.reset(self.lattice.qregisters["mz"])
-        self.circ.barrier()
+        self.lattice.stabilize(syndrome_readouts)
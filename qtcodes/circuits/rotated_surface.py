@@ -3,6 +3,7 @@ Rotated Surface Code Encoder Classes
 """
 from abc import abstractmethod, ABCMeta
 from typing import Dict, List, Tuple, Optional, Type
+import numpy as np
 from qiskit import QuantumRegister, QuantumCircuit, ClassicalRegister
 from qiskit.circuit import Qubit
 
@@ -22,6 +23,18 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
     regarding the XXZZ (CSS) Rotated Surface Code.
     """
 
+    __slots__ = (
+        "geometry",
+        "_syndrome_coords",
+        "_x_layer",
+        "_z_layer",
+        "_x_column",
+        "_z_row",
+        "_x_template",
+        "_z_template",
+        "_plaquette_data",
+    )
+
     @property
     @abstractmethod
     def stabilizer_shortnames(self) -> Dict[str, Type[_Stabilizer]]:
@@ -47,8 +60,19 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
                 This is often shared amongst multiple TQubits.
         """
         self.geometry: Dict[str, List[List[Optional[int]]]] = {}
+        self._syndrome_coords: np.ndarray = np.zeros((0, 2))
+        self._plaquette_data: Dict[str, np.ndarray] = {}
         super().__init__(params, name, circ)
 
+        # X- and Z-only layers are built on first use by entangle_x/entangle_z
+        self._x_layer: Optional[QuantumCircuit] = None
+        self._z_layer: Optional[QuantumCircuit] = None
+
+        # logical X acts on the left-most column, logical Z on the top-most row
+        self._x_column = [self._data_qreg[i] for i in range(0, self.num_data, self.d)]
+        self._z_row = [self._data_qreg[i] for i in range(self.d)]
+        self._x_template, self._z_template = self._gen_logical_templates()
+
     def _params_validate_and_generate(self) -> None:
         """
         Validate and generate params.
@@ -101,7 +125,7 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
                 value: List of lists of qubit indices comprising one plaquette.
         """
         geometry: Dict[str, List[List[Optional[int]]]] = {"mx": [], "mz": []}
-        d = int(self.params["d"])
+        d = self.d
         per_row_x = (d - 1) // 2
         per_row_z = (d + 1) // 2
         # mx geometry
@@ -112,7 +136,7 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
         bot_l: Optional[int] = None
         bot_r: Optional[int] = None
 
-        for syn in range(int(self.params["num_syn"])):
+        for syn in range(self.num_syn):
             row = syn // per_row_x
             offset = syn % per_row_x
             start = (row - 1) * d
@@ -134,7 +158,7 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
 
             geometry["mx"].append([syn, top_l, top_r, bot_l, bot_r])
 
-        for syn in range(int(self.params["num_syn"])):
+        for syn in range(self.num_syn):
             row = syn // per_row_z
             offset = syn % per_row_z
             start = row * d
@@ -154,6 +178,45 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
             geometry["mz"].append([syn, top_l, top_r, bot_l, bot_r])
         self.geometry = geometry
 
+        # dense (num_syn, 4) data qubit indices of each plaquette for readout
+        # extraction, with missing boundary corners pointing at padding index num_data
+        self._plaquette_data = {
+            stabilizer: np.array(
+                [
+                    [idx if idx is not None else self.num_data for idx in idx_list[1:]]
+                    for idx_list in idx_lists
+                ],
+                dtype=np.int32,
+            )
+            for stabilizer, idx_lists in geometry.items()
+        }
+
+    def _set_syndrome_coords(self) -> None:
+        """
+        Construct the grid coordinates of each syndrome bit for reuse in parse_readout.
+
+        Row j of self._syndrome_coords holds the (row, col) of the j-th bit
+        (counting from the right) of a syndrome readout of the form
+        "X_{N}X_{N-1}...X_{0}Z_{N}Z_{N-1}...Z_{0}".
+        """
+        d = self.d
+        num_syn = self.num_syn
+        coords = []
+
+        per_row_z = d // 2 + 1
+        for loc in range(num_syn):
+            row = 0.5 + loc // per_row_z
+            col = (0.5 - (loc // per_row_z) % 2) + (loc % per_row_z) * 2
+            coords.append((row, col))
+
+        per_row_x = d // 2
+        for loc in range(num_syn):
+            row = -0.5 + loc // per_row_x
+            col = (0.5 + (loc // per_row_x) % 2) + (loc % per_row_x) * 2
+            coords.append((row, col))
+
+        self._syndrome_coords = np.array(coords, dtype=float)
+
     def _gen_qubit_indices_and_stabilizers(
         self,
     ) -> Tuple[List[List[Qubit]], List[Type[_Stabilizer]]]:
@@ -169,6 +232,7 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
                 List of stabilizers for each plaquette.
         """
         self._set_geometry()
+        self._set_syndrome_coords()
 
         qubit_indices = []
         stabilizers = []
@@ -189,15 +253,49 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
         """
         Build/entangle just the X Syndrome circuit.
         """
-        num_x = len(self.qregisters["mx"])
-        self.entangle(self.qubit_indices[:num_x], self.stabilizers[:num_x])
+        if self._x_layer is None:
+            # mx plaquettes come first in self.geometry
+            self._x_layer = self._build_layer(
+                self.qubit_indices[: self.num_syn], self.stabilizers[: self.num_syn]
+            )
+        self._entangle_cached(self._x_layer)
 
     def entangle_z(self):
         """
         Build/entangle just the Z Syndrome circuit.
         """
-        num_x = len(self.qregisters["mx"])
-        self.entangle(self.qubit_indices[num_x:], self.stabilizers[num_x:])
+        if self._z_layer is None:
+            self._z_layer = self._build_layer(
+                self.qubit_indices[self.num_syn :], self.stabilizers[self.num_syn :]
+            )
+        self._entangle_cached(self._z_layer)
+
+    def stabilize(self, syndrome_readouts: ClassicalRegister) -> None:
+        """
+        Run a single round of stabilization (entangle, measure and reset
+        syndrome qubits), measuring into a syndrome register of the form
+        "X_{N}X_{N-1}...X_{0}Z_{N}Z_{N-1}...Z_{0}".
+        """
+        self.entangle()
+
+        # measure syndromes
+        self.circ.measure(self.qregisters["mz"], syndrome_readouts[0 : self.num_syn])
+        self.circ.measure(
+            self.qregisters["mx"], syndrome_readouts[self.num_syn : self.num_syn * 2]
+        )
+        self.circ.reset(self.qregisters["mz"])
+        self.circ.reset(self.qregisters["mx"])
+        self.circ.barrier(*self._all_qubits)
+
+    def _padded_readout_values(self, final_readout_string: str) -> np.ndarray:
+        """
+        Converts a lattice readout string into the data qubit values
+        [q_0, q_1, ..., q_{num_data-1}, 0], padded with a 0 for
+        missing plaquette corners.
+        """
+        digits = final_readout_string[::-1].encode()
+        readout_values = np.frombuffer(digits, dtype=np.uint8) - ord("0")
+        return np.append(readout_values, 0)
 
     def extract_final_stabilizer_and_logical_readout_x(
         self, final_readout_string: str, previous_syndrome_string: str
@@ -227,32 +325,17 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
                 where Z_{N}Z_{N-1}...Z_{0} is copied from the previous Z syndrome
                 readout stored in previous_syndrome_string
         """
-        readout_values = [int(q) for q in final_readout_string]
-        readout_values = readout_values[::-1]  # [q_0,q_1,...,q_24]
+        readout_values = self._padded_readout_values(final_readout_string)
 
-        x_stabilizer = ""  # "X_{N}X_{N-1}..X_{0}"
+        x_vals = readout_values[self._plaquette_data["mx"]].sum(axis=1) % 2
+        # "X_{N}X_{N-1}..X_{0}"
+        x_stabilizer = "".join(map(str, x_vals[::-1].tolist()))
 
-        for idx_list in self.geometry["mx"]:
-            stabilizer_val = (
-                sum(
-                    [
-                        readout_values[idx] if idx is not None else 0
-                        for idx in idx_list[1:]
-                    ]
-                )  # [mx, top_l, top_r, bot_l, bot_r]
-                % 2
-            )
-            x_stabilizer = str(stabilizer_val) + x_stabilizer
-
-        stabilizer_str = (
-            x_stabilizer + previous_syndrome_string[int(self.params["num_syn"]) :]
-        )
+        stabilizer_str = x_stabilizer + previous_syndrome_string[self.num_syn :]
         # X_{N}X_{N-1}...X_{0}Z_{N}Z_{N-1}...Z_{0}, where
         # Z_{N}Z_{N-1}...Z_{0} is copied from previous syndrome measurement string
 
-        logical_readout = 0
-        for idx in range(0, int(self.params["num_data"]), int(self.params["d"])):
-            logical_readout = (logical_readout + readout_values[idx]) % 2
+        logical_readout = int(readout_values[0 : self.num_data : self.d].sum() % 2)
 
         return logical_readout, stabilizer_str
 
@@ -284,32 +367,17 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
                 where X_{N}X_{N-1}...X_{0} is copied from the previous X syndrome
                 readout stored in previous_syndrome_string
         """
-        readout_values = [int(q) for q in final_readout_string]
-        readout_values = readout_values[::-1]  # [q_0,q_1,...,q_24]
+        readout_values = self._padded_readout_values(final_readout_string)
 
-        z_stabilizer = ""  # "Z_{N}Z_{N-1}..Z_{0}"
+        z_vals = readout_values[self._plaquette_data["mz"]].sum(axis=1) % 2
+        # "Z_{N}Z_{N-1}..Z_{0}"
+        z_stabilizer = "".join(map(str, z_vals[::-1].tolist()))
 
-        for idx_list in self.geometry["mz"]:
-            stabilizer_val = (
-                sum(
-                    [
-                        readout_values[idx] if idx is not None else 0
-                        for idx in idx_list[1:]
-                    ]
-                )  # [mx, top_l, top_r, bot_l, bot_r]
-                % 2
-            )
-            z_stabilizer = str(stabilizer_val) + z_stabilizer
-
-        stabilizer_str = (
-            previous_syndrome_string[: int(self.params["num_syn"])] + z_stabilizer
-        )
+        stabilizer_str = previous_syndrome_string[: self.num_syn] + z_stabilizer
         # X_{N}X_{N-1}...X_{0}Z_{N}Z_{N-1}...Z_{0}, where
         # X_{N}X_{N-1}...X_{0} is copied from previous syndrome measurement string
 
-        logical_readout = 0
-        for idx in range(int(self.params["d"])):
-            logical_readout = (logical_readout + readout_values[idx]) % 2
+        logical_readout = int(readout_values[: self.d].sum() % 2)
 
         return logical_readout, stabilizer_str
 
@@ -344,18 +412,35 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
         """
 
     @abstractmethod
+    def _gen_logical_templates(self) -> Tuple[QuantumCircuit, QuantumCircuit]:
+        """
+        Generates the physical gates of the logical X and Z operators,
+        as d-qubit circuits to be composed onto the left-most column
+        and top-most row of data qubits respectively.
+
+        Returns:
+            x_template (QuantumCircuit):
+                Logical X operator on the left-most column, top to bottom.
+
+            z_template (QuantumCircuit):
+                Logical Z operator on the top-most row, left to right.
+        """
+
     def x(self) -> None:
         """
         Logical X operator on the qubit.
         Uses the left-most column.
         """
+        self.circ.compose(self._x_template, qubits=self._x_column, inplace=True)
+        self.circ.barrier()
 
-    @abstractmethod
     def z(self) -> None:
         """
         Logical Z operator on the qubit.
         Uses the top-most row.
         """
+        self.circ.compose(self._z_template, qubits=self._z_row, inplace=True)
+        self.circ.barrier()
 
     @abstractmethod
     def readout_x(self, readout_creg: Optional[ClassicalRegister] = None) -> None:
@@ -411,8 +496,7 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
                 value: (time, row, col) of parsed syndrome hits (changes between consecutive rounds)
         """
         chunks = readout_string.split(" ")
-        d = int(self.params["d"])
-        num_syn = int(self.params["num_syn"])
+        num_syn = self.num_syn
 
         if len(chunks[0]) > 1:  # this is true when all data qubits are readout
             assert readout_type is not None
@@ -427,31 +511,16 @@ class _RotatedLattice(_TopologicalLattice[TQubit], metaclass=ABCMeta):
             logical_readout = int(chunks[0])
             chunks = chunks[1:]
 
-        int_syndromes = [int(x, base=2) for x in chunks[::-1]]
-        xor_syndromes = [a ^ b for (a, b) in zip(int_syndromes, int_syndromes[1:])]
+        # syndromes[T, j] is the j-th bit (from the right) of syndrome round T
+        syndromes = (
+            np.frombuffer("".join(chunks[::-1]).encode(), dtype=np.uint8) - ord("0")
+        ).reshape(len(chunks), 2 * num_syn)[:, ::-1]
+        T, loc = np.nonzero(np.bitwise_xor(syndromes[1:], syndromes[:-1]))
+        hits = np.column_stack((T, self._syndrome_coords[loc]))
 
-        mask_z = "1" * num_syn
-        mask_x = mask_z + "0" * num_syn
-        x_syndromes = [(x & int(mask_x, base=2)) >> num_syn for x in xor_syndromes]
-        z_syndromes = [x & int(mask_z, base=2) for x in xor_syndromes]
-
-        X = []
-        per_row_x = d // 2
-        for T, syndrome in enumerate(x_syndromes):
-            for loc in range(num_syn):
-                if syndrome & 1 << loc:
-                    row = -0.5 + loc // per_row_x
-                    col = (0.5 + (loc // per_row_x) % 2) + (loc % per_row_x) * 2
-                    X.append((float(T), row, col))
-
-        Z = []
-        per_row_z = d // 2 + 1
-        for T, syndrome in enumerate(z_syndromes):
-            for loc in range(num_syn):
-                if syndrome & 1 << loc:
-                    row = 0.5 + loc // per_row_z
-                    col = (0.5 - (loc // per_row_z) % 2) + (loc % per_row_z) * 2
-                    Z.append((float(T), row, col))
+        is_x = loc >= num_syn
+        X = [tuple(hit) for hit in hits[is_x].tolist()]
+        Z = [tuple(hit) for hit in hits[~is_x].tolist()]
 
         return (
             logical_readout,
@@ -464,6 +533,8 @@ class RotatedQubit(TopologicalQubit[TQubit], metaclass=ABCMeta):
     A single logical surface code qubit.
     """
 
+    __slots__ = ()
+
     def stabilize(self) -> None:
         """
         Run a single round of stabilization (entangle and measure).
@@ -478,19 +549,4 @@ class RotatedQubit(TopologicalQubit[TQubit], metaclass=ABCMeta):
         ] = syndrome_readouts
         self.circ.add_register(syndrome_readouts)
 
-        self.lattice.entangle()
-
-        # measure syndromes
-        self.circ.measure(
-            self.lattice.qregisters["mz"],
-            syndrome_readouts[0 : self.lattice.params["num_syn"]],
-        )
-        self.circ.measure(
-            self.lattice.qregisters["mx"],
-            syndrome_readouts[
-                self.lattice.params["num_syn"] : self.lattice.params["num_syn"] * 2
-            ],
-        )
-        self.circ.reset(self.lattice.qregisters["mz"])
-        self.circ.reset(self.lattice.qregisters["mx"])
-        self.circ.barrier()
+        self.lattice.stabilize(syndrome_readouts)
@@ -2,7 +2,7 @@
 XXZZ Surface Code Encoder Classes
 """
 from typing import Tuple, Optional
-from qiskit import ClassicalRegister
+from qiskit import QuantumCircuit, ClassicalRegister
 from qiskit.circuit import Qubit
 
 from qtcodes.circuits.base import (
@@ -20,7 +20,9 @@ class _XXXX(_Stabilizer):
     X-syndrome plaquette of the rotated CSS (XXXX/ZZZZ) surface code.
     """
 
-    def entangle(self) -> None:
+    num_steps = 4
+
+    def entangle_step(self, step: int) -> None:
         """
         Traverse in reverse "Z" pattern
         """
@@ -30,17 +32,17 @@ class _XXXX(_Stabilizer):
         bot_l = self.qubit_indices[3]
         bot_r = self.qubit_indices[4]
 
-        if (top_r and not top_l) or (bot_r and not bot_l):
-            raise LatticeError("Inconsistent X syndrome connections")
+        if step == 0:
+            if (top_r and not top_l) or (bot_r and not bot_l):
+                raise LatticeError("Inconsistent X syndrome connections")
+            self.circ.h(syndrome)
+
+        data = [top_r, top_l, bot_r, bot_l][step]
+        if data:
+            self.circ.cx(syndrome, data)
 
-        self.circ.h(syndrome)
-        if top_r:
-            self.circ.cx(syndrome, top_r)
-            self.circ.cx(syndrome, top_l)
-        if bot_r:
-            self.circ.cx(syndrome, bot_r)
-            self.circ.cx(syndrome, bot_l)
-        self.circ.h(syndrome)
+        if step == 3:
+            self.circ.h(syndrome)
 
 
 class _ZZZZ(_Stabilizer):
@@ -48,7 +50,9 @@ class _ZZZZ(_Stabilizer):
     Z-syndrome plaquette of the rotated surface code.
     """
 
-    def entangle(self) -> None:
+    num_steps = 4
+
+    def entangle_step(self, step: int) -> None:
         """
         Traverse in reverse "N" pattern
         """
@@ -58,15 +62,13 @@ class _ZZZZ(_Stabilizer):
         bot_l = self.qubit_indices[3]
         bot_r = self.qubit_indices[4]
 
-        if (top_r and not bot_r) or (top_l and not bot_l):
-            raise LatticeError("Inconsistent Z syndrome connections")
+        if step == 0:
+            if (top_r and not bot_r) or (top_l and not bot_l):
+                raise LatticeError("Inconsistent Z syndrome connections")
 
-        if top_r:
-            self.circ.cx(top_r, syndrome)
-            self.circ.cx(bot_r, syndrome)
-        if top_l:
-            self.circ.cx(top_l, syndrome)
-            self.circ.cx(bot_l, syndrome)
+        data = [top_r, bot_r, top_l, bot_l][step]
+        if data:
+            self.circ.cx(data, syndrome)
 
 
 class _XXZZLattice(_RotatedLattice):
@@ -75,6 +77,8 @@ class _XXZZLattice(_RotatedLattice):
     specifications regarding the XXZZ (CSS) Rotated Surface Code.
     """
 
+    __slots__ = ()
+
     stabilizer_shortnames = {"mx": _XXXX, "mz": _ZZZZ}
 
     def reset_x(self) -> None:
@@ -92,30 +96,24 @@ class _XXZZLattice(_RotatedLattice):
         self.circ.reset(self.qregisters["data"])
         self.circ.barrier()
 
-    def x(self) -> None:
+    def _gen_logical_templates(self) -> Tuple[QuantumCircuit, QuantumCircuit]:
         """
-        Logical X operator on the qubit.
-        Uses the left-most column.
+        Logical X is X on every qubit of the left-most column,
+        logical Z is Z on every qubit of the top-most row.
         """
-        for i in range(0, int(self.params["num_data"]), int(self.params["d"])):
-            self.circ.x(self.qregisters["data"][i])
-        self.circ.barrier()
+        x_template = QuantumCircuit(self.d)
+        x_template.x(range(self.d))
 
-    def z(self) -> None:
-        """
-        Logical Z operator on the qubit.
-        Uses the top-most row.
-        """
-        for i in range(int(self.params["d"])):
-            self.circ.z(self.qregisters["data"][i])
-        self.circ.barrier()
+        z_template = QuantumCircuit(self.d)
+        z_template.z(range(self.d))
+        return x_template, z_template
 
     def x_c_if(self, classical: ClassicalRegister, val: int) -> None:
         """
         Classically conditioned logical X operator on the topological qubit.
         Defined as the left-most column.
         """
-        for i in range(0, int(self.params["num_data"]), int(self.params["d"])):
+        for i in range(0, self.num_data, self.d):
             self.circ.x(self.qregisters["data"][i]).c_if(classical, val)
         self.circ.barrier()
 
@@ -125,7 +123,7 @@ class _XXZZLattice(_RotatedLattice):
         Defined as the top-most row.
         """
 
-        for i in range(int(self.params["d"])):
+        for i in range(self.d):
             self.circ.z(self.qregisters["data"][i]).c_if(classical, val)
         self.circ.barrier()
 
@@ -142,7 +140,7 @@ class _XXZZLattice(_RotatedLattice):
         """
         if control:
             # Taking left-most column
-            for i in range(0, int(self.params["num_data"]), int(self.params["d"])):
+            for i in range(0, self.num_data, self.d):
                 self.circ.cx(control, self.qregisters["data"][i])
             self.circ.barrier()
         elif target:
@@ -159,7 +157,7 @@ class _XXZZLattice(_RotatedLattice):
         """
         self.circ.reset(self.qregisters["ancilla"])
         self.circ.h(self.qregisters["ancilla"])
-        for i in range(0, int(self.params["num_data"]), int(self.params["d"])):
+        for i in range(0, self.num_data, self.d):
             self.circ.cx(self.qregisters["ancilla"], self.qregisters["data"][i])
         self.circ.h(self.qregisters["ancilla"])
 
@@ -189,7 +187,7 @@ class _XXZZLattice(_RotatedLattice):
         Uses the top-most row.
         """
         self.circ.reset(self.qregisters["ancilla"])
-        for i in range(int(self.params["d"])):
+        for i in range(self.d):
             self.circ.cx(self.qregisters["data"][i], self.qregisters["ancilla"])
 
     def readout_z(self, readout_creg: Optional[ClassicalRegister] = None) -> None:
@@ -256,4 +254,6 @@ class XXZZQubit(RotatedQubit):
     A single logical surface code qubit.
     """
 
+    __slots__ = ()
+
     lattice_type = _XXZZLattice
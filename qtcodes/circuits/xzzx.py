@@ -2,7 +2,7 @@
 XZZX Surface Code Encoder Classes
 """
 from typing import Tuple, Optional
-from qiskit import ClassicalRegister
+from qiskit import QuantumCircuit, ClassicalRegister
 from qiskit.circuit import Qubit
 
 from qtcodes.circuits.base import _Stabilizer
@@ -16,7 +16,9 @@ class _XZZX(_Stabilizer):
     XZZX-syndrome measurement for the rotated XZZX surface code.
     """
 
-    def entangle(self) -> None:
+    num_steps = 4
+
+    def entangle_step(self, step: int) -> None:
         """
         Parity measurement on nearby data qubits.
         Going in a "Z" traversal direction.
@@ -27,18 +29,18 @@ class _XZZX(_Stabilizer):
         bot_l = self.qubit_indices[3]
         bot_r = self.qubit_indices[4]
 
-        if top_l:  # X
+        if step == 0 and top_l:  # X
             self.circ.h(syndrome)
             self.circ.cx(syndrome, top_l)
             self.circ.h(syndrome)
 
-        if top_r:  # Z
+        if step == 1 and top_r:  # Z
             self.circ.cx(top_r, syndrome)
 
-        if bot_l:  # Z
+        if step == 2 and bot_l:  # Z
             self.circ.cx(bot_l, syndrome)
 
-        if bot_r:  # X
+        if step == 3 and bot_r:  # X
             self.circ.h(syndrome)
             self.circ.cx(syndrome, bot_r)
             self.circ.h(syndrome)
@@ -50,6 +52,8 @@ class _XZZXLattice(_RotatedLattice):
     specifications regarding the XZZX Rotated Surface Code.
     """
 
+    __slots__ = ()
+
     stabilizer_shortnames = {"mx": _XZZX, "mz": _XZZX}
 
     def reset_x(self):
@@ -66,33 +70,20 @@ class _XZZXLattice(_RotatedLattice):
         self.circ.reset(self.qregisters["data"])
         self.circ.h(self.qregisters["data"][0::2])  # H|0> = |+>
 
-    def x(self) -> None:
-        """
-        Logical X operator on the qubit.
-        Defined as the left-most column.
-        """
-
-        # Taking left-most column
-        for i in range(0, int(self.params["num_data"]), int(self.params["d"])):
-            if i % 2 == 1:
-                self.circ.x(self.qregisters["data"][i])
-            else:
-                self.circ.z(self.qregisters["data"][i])
-        self.circ.barrier()
-
-    def z(self) -> None:
+    def _gen_logical_templates(self) -> Tuple[QuantumCircuit, QuantumCircuit]:
         """
-        Logical Z operator on the qubit.
-        Defined as the top-most row.
+        Logical X alternates Z and X down the left-most column,
+        logical Z alternates X and Z along the top-most row.
         """
+        x_template = QuantumCircuit(self.d)
+        # column qubit k is data qubit k * d, with the same parity as k (d is odd)
+        x_template.z(range(0, self.d, 2))
+        x_template.x(range(1, self.d, 2))
 
-        # Taking top-most row
-        for i in range(int(self.params["d"])):
-            if i % 2 == 0:
-                self.circ.x(self.qregisters["data"][i])
-            else:
-                self.circ.z(self.qregisters["data"][i])
-        self.circ.barrier()
+        z_template = QuantumCircuit(self.d)
+        z_template.x(range(0, self.d, 2))
+        z_template.z(range(1, self.d, 2))
+        return x_template, z_template
 
     def x_c_if(self, classical: ClassicalRegister, val: int) -> None:
         """
@@ -101,7 +92,7 @@ class _XZZXLattice(_RotatedLattice):
         """
 
         # Taking left-most column
-        for i in range(0, int(self.params["num_data"]), int(self.params["d"])):
+        for i in range(0, self.num_data, self.d):
             if i % 2 == 1:
                 self.circ.x(self.qregisters["data"][i]).c_if(classical, val)
             else:
@@ -115,7 +106,7 @@ class _XZZXLattice(_RotatedLattice):
         """
 
         # Taking top-most row
-        for i in range(int(self.params["d"])):
+        for i in range(self.d):
             if i % 2 == 0:
                 self.circ.x(self.qregisters["data"][i]).c_if(classical, val)
             else:
@@ -135,7 +126,7 @@ class _XZZXLattice(_RotatedLattice):
         """
         if control:
             # Taking left-most column
-            for i in range(0, int(self.params["num_data"]), int(self.params["d"])):
+            for i in range(0, self.num_data, self.d):
                 if i % 2 == 1:
                     self.circ.cx(control, self.qregisters["data"][i])
                 else:
@@ -155,9 +146,7 @@ class _XZZXLattice(_RotatedLattice):
         self.circ.reset(self.qregisters["ancilla"])
 
         # Taking left-most column
-        data_qubit_indxs = list(
-            range(0, int(self.params["num_data"]), int(self.params["d"]))
-        )
+        data_qubit_indxs = list(range(0, self.num_data, self.d))
 
         # X Readout
         x_readout_indxs = [i for i in data_qubit_indxs if i % 2 == 1]
@@ -201,7 +190,7 @@ class _XZZXLattice(_RotatedLattice):
         self.circ.reset(self.qregisters["ancilla"])
 
         # Taking top-most row
-        data_qubit_indxs = list(range(int(self.params["d"])))
+        data_qubit_indxs = list(range(self.d))
 
         # X Readout
         x_readout_indxs = [i for i in data_qubit_indxs if i % 2 == 0]
@@ -289,4 +278,6 @@ class XZZXQubit(RotatedQubit):
     circuit, so we chose to subclass and extend TopologicalQubit which extends QuantumCircuit.
     """
 
+    __slots__ = ()
+
     lattice_type = _XZZXLattice
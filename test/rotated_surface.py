@@ -4,9 +4,11 @@ Unittests for the rotated surface codes
 import sys
 import unittest
 from qiskit import execute, Aer
+from qiskit.providers.aer import AerSimulator
 
 sys.path.insert(0, "../")
-from qtcodes import XXZZQubit, RotatedDecoder
+from qtcodes import XXZZQubit, XZZXQubit, RotatedDecoder
+from qtcodes.circuits.base import _Stabilizer
 
 
 class TestXXZZ(unittest.TestCase):
@@ -132,6 +134,181 @@ class TestXXZZ(unittest.TestCase):
                     for x in nodes:
                         self.assertIn(x, expected_neighbors)
 
+    def test_parallel_stabilizer_schedule(self):
+        """
+        Setting up a |+z> state and stabilizing three times without errors.
+
+        Then, testing that the interleaved CNOT schedule of all plaquettes
+        measures consistent stabilizers, i.e. no syndrome changes between rounds,
+        for both the XXZZ and XZZX codes.
+        """
+        for qubit_type in [XXZZQubit, XZZXQubit]:
+            for d in [3, 5, 7]:
+                qubit = qubit_type({"d": d})
+                qubit.reset_z()
+                for _ in range(3):
+                    qubit.stabilize()
+                qubit.readout_z()
+
+                # the circuits are Clifford and too wide for a statevector
+                results = (
+                    execute(qubit.circ, AerSimulator(method="stabilizer"), shots=100,)
+                    .result()
+                    .get_counts()
+                )
+                for readout_string in results:
+                    logical_readout, syndromes = qubit.parse_readout(readout_string)
+                    self.assertEqual(
+                        syndromes,
+                        {"X": [], "Z": []},
+                        f"Inconsistent stabilizers for {qubit_type.__name__}, d={d}.",
+                    )
+                    self.assertEqual(logical_readout, 0)
+
+    def test_entangle_only_stabilizer(self):
+        """
+        Checking that a stabilizer implementing only entangle runs entirely
+        in the first time step when mixed with 4-step plaquettes,
+        with one barrier across the lattice after each time step.
+        """
+
+        class _ZZ(_Stabilizer):
+            def entangle(self):
+                for data in self.qubit_indices[1:]:
+                    if data is not None:
+                        self.circ.cx(data, self.qubit_indices[0])
+
+        qubit = XXZZQubit({"d": 3})
+        lattice = qubit.lattice
+        num_syn = lattice.num_syn
+        # mx plaquettes come first, swap out the mz plaquettes
+        stabilizers = lattice.stabilizers[:num_syn] + [_ZZ] * num_syn
+
+        start = len(qubit.circ.data)
+        lattice.entangle(lattice.qubit_indices, stabilizers)
+        instructions = qubit.circ.data[start:]
+
+        barriers = [
+            i
+            for i, instruction in enumerate(instructions)
+            if instruction.operation.name == "barrier"
+        ]
+        self.assertEqual(len(barriers), 4)
+        for i in barriers:
+            self.assertEqual(len(instructions[i].qubits), qubit.circ.num_qubits)
+
+        mz_qubits = set(lattice.qregisters["mz"])
+        zz_positions = [
+            i
+            for i, instruction in enumerate(instructions)
+            if instruction.operation.name == "cx"
+            and instruction.qubits[1] in mz_qubits
+        ]
+        num_zz_cx = sum(
+            data is not None
+            for plaquette in lattice.qubit_indices[num_syn:]
+            for data in plaquette[1:]
+        )
+        self.assertEqual(len(zz_positions), num_zz_cx)
+        self.assertTrue(all(i < barriers[0] for i in zz_positions))
+
+    def test_parse_readout(self):
+        """
+        Checking that multi-round readout strings, with either a logical readout
+        or a full lattice readout prefix, are parsed into the expected logical
+        readout value and (time, row, col) syndrome hits.
+        """
+        qubit = XXZZQubit({"d": 3})
+        cases = [
+            (
+                "1 00100000 10000001 00000000",
+                None,
+                (
+                    1,
+                    {
+                        "X": [(0.0, 2.5, 1.5), (1.0, 0.5, 1.5), (1.0, 2.5, 1.5)],
+                        "Z": [(0.0, 0.5, 0.5), (1.0, 0.5, 0.5)],
+                    },
+                ),
+            ),
+            ("0 01000010 01000010", None, (0, {"X": [], "Z": []})),
+            ("0 00000000", None, (0, {"X": [], "Z": []})),
+            (
+                "100000000 00000001 00000000",
+                "Z",
+                (0, {"X": [], "Z": [(0.0, 0.5, 0.5), (1.0, 0.5, 0.5), (1.0, 1.5, 1.5)]}),
+            ),
+            (
+                "000000001 00000000 00000000",
+                "Z",
+                (1, {"X": [], "Z": [(1.0, 0.5, 0.5)]}),
+            ),
+            (
+                "000010000 10000000 00000000",
+                "X",
+                (
+                    0,
+                    {
+                        "X": [
+                            (0.0, 2.5, 1.5),
+                            (1.0, 0.5, 1.5),
+                            (1.0, 1.5, 0.5),
+                            (1.0, 2.5, 1.5),
+                        ],
+                        "Z": [],
+                    },
+                ),
+            ),
+        ]
+        for readout_string, readout_type, expected in cases:
+            self.assertEqual(
+                qubit.parse_readout(readout_string, readout_type), expected
+            )
+
+    def test_extract_final_stabilizer_and_logical_readout(self):
+        """
+        Checking that a lattice readout is turned into the expected logical readout
+        and final round of X or Z stabilizers, with the other stabilizer type
+        copied from the previous syndrome string.
+        """
+        lattice = XXZZQubit({"d": 3}).lattice
+        cases = [
+            ("000000001", "01100001", (1, "00010001"), (1, "01100001")),
+            ("100000000", "10010110", (0, "10000110"), (0, "10011000")),
+            ("000010000", "00000000", (0, "01100000"), (0, "00001001")),
+            ("110000011", "11111111", (1, "01101111"), (0, "11110000")),
+        ]
+        for final_readout, previous_syndrome, expected_x, expected_z in cases:
+            self.assertEqual(
+                lattice.extract_final_stabilizer_and_logical_readout_x(
+                    final_readout, previous_syndrome
+                ),
+                expected_x,
+            )
+            self.assertEqual(
+                lattice.extract_final_stabilizer_and_logical_readout_z(
+                    final_readout, previous_syndrome
+                ),
+                expected_z,
+            )
+
+    def test_str(self):
+        """
+        Checking that str gives a short summary rather than a circuit drawing.
+        """
+        qubit = XXZZQubit({"d": 3})
+        self.assertEqual(
+            str(qubit), "XXZZQubit(name='tq', lattice=_XXZZLattice, gates=0)"
+        )
+        qubit.reset_z()
+        qubit.stabilize()
+        self.assertEqual(
+            str(qubit),
+            "XXZZQubit(name='tq', lattice=_XXZZLattice, gates={})".format(
+                len(qubit.circ.data)
+            ),
+        )
+
 
 # %%
 